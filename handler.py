@@ -4,133 +4,229 @@ Runpod Serverless Handler for YouTube → Whisper → SRT pipeline
 Transcribes YouTube videos to English and uploads SRT files to S3-compatible storage
 """
 
+import io
 import os
-import sys
 import json
+import logging
 import tempfile
 import subprocess
 import re
+import signal
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import timedelta
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, Union
 
 import runpod
-import boto3
-import whisper
 
-# Global model cache
+# numpy, boto3 and faster_whisper are imported where they are first used so that
+# importing this module (and registering with runpod) stays fast
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger("handler")
+
+# Whisper operates on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+# YouTube video ID in watch, short-link, Shorts and embed URLs
+_VIDEO_ID_RE = re.compile(r"(?:youtube\.com/(?:watch\?v=|shorts/|embed/)|youtu\.be/)([0-9A-Za-z_-]{11})")
+
+# VTT cue timing line; only these timestamps are rewritten, never cue text
+_VTT_TIMING_RE = re.compile(r"^(\S+)\.(\d{3}) --> (\S+)\.(\d{3})$", re.M)
+
+# Global model cache. The model stays resident on the GPU for the lifetime of the
+# worker process; never release it or empty the CUDA cache between jobs.
 current_model = None
 current_model_name = None
 
+# Model used by default; the Dockerfile sets this to the model it bakes into the image
+DEFAULT_MODEL = os.getenv("WHISPER_MODEL", "large-v3-turbo")
 
-def get_model(model_name: str = "large-v3-turbo"):
+# Directory holding CTranslate2 models baked into the image (see Dockerfile)
+MODEL_DIR = os.getenv("WHISPER_MODEL_DIR", "/models")
+
+# Download cache for models that aren't baked in; point at a network volume to persist it
+CACHE_DIR = os.getenv("WHISPER_CACHE_DIR")
+
+SUBTITLE_CONTENT_TYPES = {
+    ".srt": "application/x-subrip",
+    ".vtt": "text/vtt",
+}
+
+
+def get_model(model_name: str = DEFAULT_MODEL):
     """Load and cache Whisper model"""
     global current_model, current_model_name
 
     if current_model is not None and current_model_name == model_name:
         return current_model
 
-    print(f"Loading Whisper model: {model_name}")
-    current_model = whisper.load_model(model_name, device="cuda")
+    from faster_whisper import WhisperModel
+
+    # INT8 weights with FP16 activations: half the weight bandwidth of pure FP16
+    compute_type = os.getenv("WHISPER_COMPUTE_TYPE", "int8_float16")
+
+    # Prefer pre-baked weights so a cold start never hits the network
+    model_path = os.path.join(MODEL_DIR, model_name)
+    if not os.path.isdir(model_path):
+        model_path = model_name
+
+    logger.info("Loading Whisper model: %s (%s)", model_path, compute_type)
+    current_model = WhisperModel(
+        model_path,
+        device="cuda",
+        compute_type=compute_type,
+        download_root=CACHE_DIR
+    )
     current_model_name = model_name
     return current_model
 
 
 def format_timestamp(seconds: float) -> str:
     """Convert seconds to SRT timestamp format (HH:MM:SS,mmm)"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
+    # Work in integer milliseconds so every field derives from one rounded value
+    millis = round(seconds * 1000)
+    secs, millis = divmod(millis, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
-def transcribe_to_srt(audio_path: str, model_name: str = "large-v3-turbo", language: str = "en") -> str:
+def transcribe_to_subtitles(
+    audio: Union[str, "np.ndarray"],
+    model_name: str = DEFAULT_MODEL,
+    language: str = "en"
+) -> Tuple[str, str]:
     """
-    Transcribe audio file to SRT format
-    Returns the SRT content as a string
+    Transcribe audio to SRT and WebVTT formats in a single pass
+    Returns (srt_content, vtt_content)
 
     Args:
-        audio_path: Path to audio file
-        model_name: Whisper model name (default: "large")
+        audio: Path to audio file, or 16 kHz mono float32 samples
+        model_name: Whisper model name (default: WHISPER_MODEL env var, else "large-v3-turbo")
         language: ISO 639-1 language code for transcription (default: "en")
                   Supported: en, ko, ja, zh, etc. (all Whisper-supported languages)
     """
-    print(f"Transcribing audio file: {audio_path} (language: {language})")
-
     model = get_model(model_name)
-    result = model.transcribe(audio_path, language=language, fp16=True)
+    # Segments are yielded lazily; decoding happens while we iterate.
+    # VAD drops silence/music longer than half a second before it reaches the decoder.
+    segments, info = model.transcribe(
+        audio,
+        language=language,
+        beam_size=5,
+        vad_filter=True,
+        vad_parameters=dict(min_silence_duration_ms=500)
+    )
+    logger.info("Transcribing %.0fs of audio (language: %s)", info.duration, language)
 
-    srt_content = []
-    for idx, segment in enumerate(result["segments"], 1):
-        start_time = format_timestamp(segment["start"])
-        end_time = format_timestamp(segment["end"])
-        text = segment["text"].strip()
+    # Write each cue to both formats as it is decoded; they differ only in the
+    # header and the millisecond separator (HH:MM:SS,mmm vs HH:MM:SS.mmm)
+    srt_buffer = io.StringIO()
+    vtt_buffer = io.StringIO()
+    vtt_buffer.write("WEBVTT\n\n")
+    for idx, segment in enumerate(segments, 1):
+        start_time = format_timestamp(segment.start)
+        end_time = format_timestamp(segment.end)
+        text = segment.text.strip()
 
-        srt_content.append(f"{idx}\n{start_time} --> {end_time}\n{text}\n")
+        timing = f"{start_time} --> {end_time}"
+        srt_buffer.write(f"{idx}\n{timing}\n{text}\n\n")
+        vtt_buffer.write(f"{idx}\n{timing.replace(',', '.')}\n{text}\n\n")
 
-    return "\n".join(srt_content)
+    return srt_buffer.getvalue(), vtt_buffer.getvalue()
 
 
-def srt_to_vtt(srt_content: str) -> str:
+def vtt_to_srt(vtt_content: str) -> str:
     """
-    Convert SRT format to WebVTT format
-    WebVTT header + SRT content with timestamp adjustments
+    Convert WebVTT stored in storage/raw/ back to SRT format
+    Handles both transcribe_to_subtitles output and older files written with an extra
+    blank line after the header; drops the WEBVTT header and restores SRT timing lines
     """
-    vtt_lines = ["WEBVTT", "", ""]
-
-    for line in srt_content.split("\n"):
-        if line.strip() == "":
-            vtt_lines.append("")
-        elif "-->" in line:
-            # Convert SRT timestamp (HH:MM:SS,mmm) to VTT timestamp (HH:MM:SS.mmm)
-            vtt_timestamp = line.replace(",", ".")
-            vtt_lines.append(vtt_timestamp)
-        else:
-            vtt_lines.append(line)
-
-    return "\n".join(vtt_lines)
+    _header, _, cues = vtt_content.partition("\n\n")
+    return _VTT_TIMING_RE.sub(r"\1,\2 --> \3,\4", cues.lstrip("\n"))
 
 
 def extract_video_id(youtube_url: str) -> str:
     """
     Extract YouTube video ID from various URL formats
-    Supports: youtube.com/watch?v=... and youtu.be/...
+    Supports: youtube.com/watch?v=..., youtu.be/..., youtube.com/shorts/... and youtube.com/embed/...
     """
-    pattern = r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([0-9A-Za-z_-]{11})'
-    match = re.search(pattern, youtube_url)
+    match = _VIDEO_ID_RE.search(youtube_url)
     if match:
         return match.group(1)
     raise ValueError(f"Could not extract video ID from URL: {youtube_url}")
 
 
-def _download_with_ytdlp(youtube_url: str, output_dir: str) -> str:
-    """Download YouTube audio using yt-dlp"""
-    output_template = os.path.join(output_dir, "%(title)s.%(ext)s")
-    result = subprocess.run(
-        [
-            "yt-dlp",
-            "-f", "bestaudio/best",
-            "-x",
-            "--audio-format", "mp3",
-            "--audio-quality", "192",
-            "-o", output_template,
-            youtube_url
-        ],
-        capture_output=True,
-        text=True,
-        timeout=300
-    )
-
-    if result.returncode != 0:
-        raise Exception(f"yt-dlp failed: {result.stderr}")
-
-    # Find the downloaded audio file
-    mp3_files = list(Path(output_dir).glob("*.mp3"))
-    if not mp3_files:
-        raise Exception("No MP3 file found after yt-dlp download")
+def _download_with_ytdlp(youtube_url: str) -> "np.ndarray":
+    """Stream YouTube audio via yt-dlp and decode it to 16 kHz mono float32 samples with ffmpeg"""
+    import numpy as np
+
+    # yt-dlp's stderr goes to a temp file so a chatty download can't fill the pipe and stall
+    with tempfile.TemporaryFile() as ytdlp_stderr:
+        ytdlp = subprocess.Popen(
+            [
+                "yt-dlp",
+                "-f", "bestaudio/best",
+                # Parallel DASH/HLS fragments and ranged chunks sidestep per-connection throttling
+                "--concurrent-fragments", "4",
+                "--http-chunk-size", "10M",
+                "--no-progress",
+                "-o", "-",
+                youtube_url
+            ],
+            stdout=subprocess.PIPE,
+            stderr=ytdlp_stderr
+        )
+        ffmpeg = subprocess.Popen(
+            [
+                "ffmpeg",
+                "-nostdin",
+                "-loglevel", "error",
+                "-i", "pipe:0",
+                "-vn",
+                "-ac", "1",
+                "-ar", str(SAMPLE_RATE),
+                "-f", "f32le",
+                "pipe:1"
+            ],
+            stdin=ytdlp.stdout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        # Only ffmpeg holds the read end now, so yt-dlp gets SIGPIPE if ffmpeg dies
+        ytdlp.stdout.close()
+
+        try:
+            pcm, ffmpeg_error = ffmpeg.communicate(timeout=300)
+            ytdlp.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            ffmpeg.kill()
+            ytdlp.kill()
+            ffmpeg.communicate()
+            ytdlp.wait()
+            raise Exception("yt-dlp download timed out")
+
+        ytdlp_stderr.seek(0)
+        ytdlp_error = ytdlp_stderr.read().decode(errors="replace")
+
+    # A yt-dlp failure (unavailable video, bot check, ...) also leaves ffmpeg with empty input,
+    # so report it first -- unless yt-dlp only died of a broken pipe because ffmpeg exited
+    ytdlp_broken_pipe = ytdlp.returncode == -signal.SIGPIPE or "Broken pipe" in ytdlp_error
+    if ytdlp.returncode != 0 and not ytdlp_broken_pipe:
+        raise Exception(f"yt-dlp failed: {ytdlp_error}")
+    if ffmpeg.returncode != 0:
+        raise Exception(
+            f"ffmpeg failed to decode yt-dlp stream: {ffmpeg_error.decode(errors='replace')}"
+            f" (yt-dlp stderr: {ytdlp_error})"
+        )
+    if ytdlp.returncode != 0:
+        raise Exception(f"yt-dlp failed: {ytdlp_error}")
+    if not pcm:
+        raise Exception("No audio decoded from yt-dlp stream")
 
-    return str(mp3_files[0])
+    return np.frombuffer(pcm, dtype=np.float32)
 
 
 def _download_with_pytube(youtube_url: str, output_dir: str) -> str:
@@ -145,66 +241,46 @@ def _download_with_pytube(youtube_url: str, output_dir: str) -> str:
     if not audio_stream:
         raise Exception("No audio stream found via pytube")
 
-    # Download to output directory
+    # Download to output directory; Whisper decodes the m4a/webm container directly
     downloaded_path = audio_stream.download(output_path=output_dir)
-    print(f"pytube downloaded: {downloaded_path}")
-
-    # Convert to mp3 if needed (pytube downloads as m4a/webm)
-    output_path = Path(downloaded_path)
-    if output_path.suffix.lower() != '.mp3':
-        mp3_path = output_path.with_suffix('.mp3')
-        # Use ffmpeg to convert
-        result = subprocess.run(
-            ['ffmpeg', '-i', str(output_path), '-vn', '-acodec', 'libmp3lame', '-q:a', '2', str(mp3_path)],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        if result.returncode != 0:
-            # If ffmpeg fails, try using pydub
-            from pydub import AudioSegment
-            audio = AudioSegment.from_file(str(output_path))
-            audio.export(str(mp3_path), format='mp3', bitrate='192k')
-
-        # Remove original file
-        output_path.unlink()
-        return str(mp3_path)
+    logger.info("pytube downloaded: %s", downloaded_path)
 
     return downloaded_path
 
 
-def download_youtube_audio(youtube_url: str, output_dir: str) -> str:
-    """Download YouTube video audio - tries yt-dlp first, falls back to pytube"""
-    print(f"Downloading audio from: {youtube_url}")
+def download_youtube_audio(youtube_url: str, output_dir: str) -> Union[str, "np.ndarray"]:
+    """
+    Download YouTube video audio - tries yt-dlp first, falls back to pytube
+    Returns decoded samples from yt-dlp, or a file path in output_dir from pytube
+    """
+    logger.info("Downloading audio from: %s", youtube_url)
 
     # Try yt-dlp first (generally more reliable and faster)
     try:
-        audio_path = _download_with_ytdlp(youtube_url, output_dir)
-        print(f"Downloaded audio via yt-dlp: {audio_path}")
-        return audio_path
+        audio = _download_with_ytdlp(youtube_url)
+        logger.info("Downloaded audio via yt-dlp: %.0fs", len(audio) / SAMPLE_RATE)
+        return audio
     except Exception as e:
-        print(f"yt-dlp failed: {e}")
-        print("Attempting pytube fallback...")
+        logger.warning("yt-dlp failed: %s", e)
+        logger.info("Attempting pytube fallback...")
 
     # Fallback to pytube
     try:
         audio_path = _download_with_pytube(youtube_url, output_dir)
-        print(f"Downloaded audio via pytube fallback: {audio_path}")
+        logger.info("Downloaded audio via pytube fallback: %s", audio_path)
         return audio_path
     except Exception as e:
         raise Exception(f"All download methods failed. yt-dlp and pytube both failed. Last error: {str(e)}")
 
 
-def upload_to_s3(
-    file_path: str,
-    bucket: str,
-    key: str,
+@functools.lru_cache(maxsize=4)
+def get_s3_client(
     endpoint_url: Optional[str] = None,
     aws_access_key: Optional[str] = None,
     aws_secret_key: Optional[str] = None
-) -> str:
-    """Upload file to S3-compatible storage and return the S3 path"""
-    print(f"Uploading to S3: s3://{bucket}/{key}")
+):
+    """Create and cache an S3 client for S3-compatible storage (reused across warm invocations)"""
+    import boto3
 
     s3_kwargs = {}
     if endpoint_url:
@@ -213,11 +289,42 @@ def upload_to_s3(
         s3_kwargs["aws_access_key_id"] = aws_access_key
         s3_kwargs["aws_secret_access_key"] = aws_secret_key
 
-    s3_client = boto3.client("s3", **s3_kwargs)
+    return boto3.client("s3", **s3_kwargs)
+
+
+def download_text_from_s3(s3_client, bucket: str, key: str) -> Optional[str]:
+    """
+    Fetch a text object from S3-compatible storage
+    Returns None if the key doesn't exist or can't be read; callers treat that as a cache miss
+    """
+    from botocore.exceptions import ClientError
 
     try:
-        s3_client.upload_file(file_path, bucket, key)
-        print(f"Successfully uploaded to s3://{bucket}/{key}")
+        response = s3_client.get_object(Bucket=bucket, Key=key)
+        return response["Body"].read().decode("utf-8")
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+            # e.g. 403 AccessDenied for missing keys when credentials lack s3:ListBucket
+            logger.warning("S3 lookup of s3://%s/%s failed, treating as a miss: %s", bucket, key, e)
+        return None
+    except Exception as e:
+        logger.warning("S3 lookup of s3://%s/%s failed, treating as a miss: %s", bucket, key, e)
+        return None
+
+
+def upload_to_s3(s3_client, content: str, bucket: str, key: str) -> str:
+    """Upload text content to S3-compatible storage and return the S3 path"""
+    logger.info("Uploading to S3: s3://%s/%s", bucket, key)
+
+    try:
+        extra_args = {}
+        content_type = SUBTITLE_CONTENT_TYPES.get(Path(key).suffix)
+        if content_type:
+            extra_args["ContentType"] = content_type
+
+        # Subtitles are already in memory; a single PUT avoids a temp-file round trip
+        s3_client.put_object(Bucket=bucket, Key=key, Body=content.encode("utf-8"), **extra_args)
+        logger.info("Successfully uploaded to s3://%s/%s", bucket, key)
         return f"s3://{bucket}/{key}"
     except Exception as e:
         raise Exception(f"S3 upload failed: {str(e)}")
@@ -236,7 +343,8 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
         "s3_key_prefix": "transcriptions/",
         "s3_endpoint_url": "https://s3.example.com",
         "aws_access_key": "...",
-        "aws_secret_key": "..."
+        "aws_secret_key": "...",
+        "force": false  // Re-transcribe even if a VTT for this video/language exists
     }
     """
     try:
@@ -245,8 +353,9 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
         youtube_url = job_input.get("youtube_url")
         request_id = job_input.get("request_id", "unknown")
         language = job_input.get("language", "en")  # ISO 639-1 code (default: English)
+        force = job_input.get("force") is True  # Only a JSON true bypasses the cache, not "false"
 
-        print(f"Processing request: {request_id}, language: {language}")
+        logger.info("Processing request: %s, language: %s", request_id, language)
 
         if not youtube_url:
             return {
@@ -255,11 +364,12 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
                 "request_id": request_id
             }
 
-        # Debug: Print all RUNPOD_SECRET_ environment variables
-        print("DEBUG: Checking for RUNPOD_SECRET_ environment variables:")
-        for key, value in os.environ.items():
-            if key.startswith("RUNPOD_SECRET_"):
-                print(f"  {key}: {'***' if 'SECRET' in key or 'KEY' in key else value}")
+        # Debug: Log all RUNPOD_SECRET_ environment variables (only with DEBUG=1)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking for RUNPOD_SECRET_ environment variables:")
+            for key, value in os.environ.items():
+                if key.startswith("RUNPOD_SECRET_"):
+                    logger.debug("  %s: %s", key, "***" if "SECRET" in key or "KEY" in key else value)
 
         # S3 configuration (can come from input or environment)
         s3_bucket = job_input.get("s3_bucket") or os.getenv("RUNPOD_SECRET_S3_BUCKET")
@@ -268,10 +378,10 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
         aws_access_key = job_input.get("aws_access_key") or os.getenv("RUNPOD_SECRET_AWS_ACCESS_KEY_ID")
         aws_secret_key = job_input.get("aws_secret_key") or os.getenv("RUNPOD_SECRET_AWS_SECRET_ACCESS_KEY")
 
-        print(f"DEBUG: s3_bucket = {s3_bucket}")
-        print(f"DEBUG: s3_endpoint = {s3_endpoint}")
-        print(f"DEBUG: aws_access_key = {'***' if aws_access_key else None}")
-        print(f"DEBUG: aws_secret_key = {'***' if aws_secret_key else None}")
+        logger.debug("s3_bucket = %s", s3_bucket)
+        logger.debug("s3_endpoint = %s", s3_endpoint)
+        logger.debug("aws_access_key = %s", "***" if aws_access_key else None)
+        logger.debug("aws_secret_key = %s", "***" if aws_secret_key else None)
 
         if not s3_bucket:
             return {
@@ -280,55 +390,55 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
                 "request_id": request_id
             }
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Step 1: Download audio from YouTube
-            audio_path = download_youtube_audio(youtube_url, tmpdir)
-
-            # Step 2: Transcribe to SRT in specified language
-            srt_content = transcribe_to_srt(audio_path, language=language)
-
-            # Step 3: Extract video_id from YouTube URL
-            video_id = extract_video_id(youtube_url)
-            print(f"Extracted video_id: {video_id}")
-
-            # Step 4: Save SRT locally and upload to S3
-            srt_filename = f"{request_id}.srt"
-            srt_local_path = os.path.join(tmpdir, srt_filename)
-            with open(srt_local_path, "w") as f:
-                f.write(srt_content)
-
-            s3_key = f"{s3_key_prefix}{srt_filename}"
-            s3_path = upload_to_s3(
-                srt_local_path,
-                s3_bucket,
-                s3_key,
-                endpoint_url=s3_endpoint,
-                aws_access_key=aws_access_key,
-                aws_secret_key=aws_secret_key
-            )
-
-            # Step 5: Convert SRT to VTT and upload raw VTT to storage/raw/
-            vtt_content = srt_to_vtt(srt_content)
-            vtt_filename = f"{video_id}.{language}.vtt"  # Use language code in filename
-            vtt_local_path = os.path.join(tmpdir, vtt_filename)
-            with open(vtt_local_path, "w") as f:
-                f.write(vtt_content)
-
-            raw_vtt_key = f"storage/raw/{vtt_filename}"
-            raw_vtt_path = upload_to_s3(
-                vtt_local_path,
-                s3_bucket,
-                raw_vtt_key,
-                endpoint_url=s3_endpoint,
-                aws_access_key=aws_access_key,
-                aws_secret_key=aws_secret_key
-            )
-            print(f"Uploaded raw VTT to: {raw_vtt_path}")
+        # Step 1: Extract video_id from YouTube URL; (video_id, language) identifies the transcript
+        video_id = extract_video_id(youtube_url)
+        logger.info("Extracted video_id: %s", video_id)
+
+        s3_client = get_s3_client(
+            endpoint_url=s3_endpoint,
+            aws_access_key=aws_access_key,
+            aws_secret_key=aws_secret_key
+        )
+        srt_filename = f"{request_id}.srt"
+        s3_key = f"{s3_key_prefix}{srt_filename}"
+        vtt_filename = f"{video_id}.{language}.vtt"  # Use language code in filename
+        raw_vtt_key = f"storage/raw/{vtt_filename}"
+
+        # Step 2: Reuse the raw VTT from an earlier job for this video and language, if any
+        cached_vtt = None if force else download_text_from_s3(s3_client, s3_bucket, raw_vtt_key)
+
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(max_workers=2) as executor:
+            if cached_vtt is not None:
+                logger.info("Found existing transcript at s3://%s/%s, skipping transcription", s3_bucket, raw_vtt_key)
+                srt_content = vtt_to_srt(cached_vtt)
+                vtt_content = None
+            else:
+                # Step 3: Load the model in the background while audio downloads from YouTube
+                # (resolves immediately on warm workers)
+                model_future = executor.submit(get_model)
+                audio = download_youtube_audio(youtube_url, tmpdir)
+                model_future.result()
+
+                # Step 4: Transcribe to SRT and VTT in specified language
+                srt_content, vtt_content = transcribe_to_subtitles(audio, language=language)
+
+            # Step 5: Upload SRT and raw VTT (storage/raw/) concurrently
+            srt_future = executor.submit(upload_to_s3, s3_client, srt_content, s3_bucket, s3_key)
+
+            if vtt_content is not None:
+                vtt_future = executor.submit(upload_to_s3, s3_client, vtt_content, s3_bucket, raw_vtt_key)
+                raw_vtt_path = vtt_future.result()
+                logger.info("Uploaded raw VTT to: %s", raw_vtt_path)
+            else:
+                raw_vtt_path = f"s3://{s3_bucket}/{raw_vtt_key}"
+
+            s3_path = srt_future.result()
 
         return {
             "status": "done",
             "request_id": request_id,
             "language": language,
+            "cached": cached_vtt is not None,
             "srt_path": s3_path,
             "srt_key": s3_key,
             "srt_bucket": s3_bucket,
@@ -337,7 +447,7 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
         }
 
     except Exception as e:
-        print(f"Handler error: {str(e)}", file=sys.stderr)
+        logger.exception("Handler error: %s", e)
         return {
             "status": "error",
             "error": str(e),
@@ -346,5 +456,11 @@ def handler(event: Dict[str, Any]) -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
-    print("Starting Runpod Serverless handler for YouTube Whisper transcription v1")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    # Debug only this module; root-level DEBUG would let botocore log request bodies and signed headers
+    if os.getenv("DEBUG") == "1":
+        logger.setLevel(logging.DEBUG)
+    logger.info("Starting Runpod Serverless handler for YouTube Whisper transcription v1")
+    # Load the model before accepting jobs so the first invocation starts warm
+    get_model()
     runpod.serverless.start({"handler": handler})